@@ -1,10 +1,137 @@
 import logging
+import math
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
-from PIL import Image, ImageFilter, ImageOps
+from PIL import Image, ImageDraw, ImageFilter, ImageOps
+
+try:
+    from cykooz_resizer import CropBox, FilterType, ResizeAlg, ResizeOptions, Resizer
+except ImportError:
+    Resizer = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
 
 logger = logging.getLogger(__name__)
 
+# Bound once to skip the attribute lookups on every resize and blur.
+_LANCZOS = Image.Resampling.LANCZOS
+_BILINEAR = Image.Resampling.BILINEAR
+_GAUSSIAN = ImageFilter.GaussianBlur
+
+# SIMD Lanczos3 resizer (optional `fast` extra), shared by all Imager instances.
+_resizer = Resizer() if Resizer is not None else None
+_resize_options = (
+    ResizeOptions(resize_alg=ResizeAlg.convolution(FilterType.lanczos3))
+    if Resizer is not None
+    else None
+)
+_FAST_RESIZE_MODES = ("RGB", "RGBA", "L")
+# Modes `Image.reduce` rejects, so they cannot be pre-reduced
+_NON_REDUCIBLE_MODES = ("1", "P", "I;16", "I;16L", "I;16B", "I;16N")
+# Half-width of the Lanczos3 kernel, in source pixels per target pixel
+_LANCZOS_SUPPORT = 3.0
+
+
+def _fast_resize(
+    image: Image.Image,
+    size: tuple[int, int],
+    box: tuple[float, float, float, float] | None = None,
+    reducing_gap: float | None = None,
+) -> Image.Image:
+    """
+    Returns the `image` (or its `box` region) resized to `size` with
+    a Lanczos filter, using the SIMD resizer when available and Pillow otherwise.
+
+    Args:
+        image (Image.Image): The image to be resized.
+        size (tuple[int, int]): The target (width, height).
+        box (tuple[float, float, float, float] | None): Source region
+        (left, top, right, bottom) to resize; the whole image if None.
+        reducing_gap (float | None): If set, first shrink the image by
+        an integer factor with `Image.reduce`, as Pillow's `resize` does.
+    """
+    if image.mode in _NON_REDUCIBLE_MODES:
+        reducing_gap = None
+
+    if _resizer is None or image.mode not in _FAST_RESIZE_MODES:
+        return image.resize(
+            size,
+            resample=_LANCZOS,
+            box=box,
+            reducing_gap=reducing_gap,
+        )
+
+    if reducing_gap is not None:
+        left, top, right, bottom = box or (0, 0, image.width, image.height)
+        factor_x = int((right - left) / size[0] / reducing_gap) or 1
+        factor_y = int((bottom - top) / size[1] / reducing_gap) or 1
+        if factor_x > 1 or factor_y > 1:
+            # Reduce only the region the filter reads, as Pillow's resize does
+            support_x = (_LANCZOS_SUPPORT - 0.5) * (right - left) / size[0]
+            support_y = (_LANCZOS_SUPPORT - 0.5) * (bottom - top) / size[1]
+            reduce_box = (
+                max(0, int(left - support_x)),
+                max(0, int(top - support_y)),
+                min(image.width, math.ceil(right + support_x)),
+                min(image.height, math.ceil(bottom + support_y)),
+            )
+            image = image.reduce((factor_x, factor_y), box=reduce_box)
+            box = (
+                (left - reduce_box[0]) / factor_x,
+                (top - reduce_box[1]) / factor_y,
+                (right - reduce_box[0]) / factor_x,
+                (bottom - reduce_box[1]) / factor_y,
+            )
+
+    options = _resize_options
+    if box is not None:
+        left, top, right, bottom = box
+        options = options.copy()
+        options.crop_box = CropBox(left, top, right - left, bottom - top)
+
+    resized = Image.new(image.mode, size)
+    _resizer.resize_pil(image, resized, options)
+    return resized
+
+
+# Stack blur radius matching a Gaussian sigma, and the largest kernel
+# OpenCV's 8-bit stack blur handles without overflowing its accumulators.
+_STACK_BLUR_SIGMA_FACTOR = 2.4
+_STACK_BLUR_MAX_KERNEL = 361
+_FAST_BLUR_MODES = ("RGB", "L")
+
+
+def _fast_gaussian_blur(image: Image.Image, radius: float) -> Image.Image:
+    """
+    Returns the `image` blurred with a Gaussian of the given `radius`, using
+    OpenCV's SIMD stack blur when available and Pillow otherwise.
+
+    Args:
+        image (Image.Image): The image to be blurred.
+        radius (float): Standard deviation of the Gaussian kernel.
+    """
+    kernel = 2 * round(radius * _STACK_BLUR_SIGMA_FACTOR) + 1
+    if (
+        cv2 is None
+        or image.mode not in _FAST_BLUR_MODES
+        or kernel > min(_STACK_BLUR_MAX_KERNEL, image.width, image.height)
+    ):
+        return image.filter(_GAUSSIAN(radius=radius))
+
+    blurred = cv2.stackBlur(np.asarray(image), (kernel, kernel))
+    return Image.fromarray(blurred)
+
 
 @dataclass
 class Config:
@@ -38,20 +165,65 @@ class Imager:
     # Cap upscaling at 2x original size to avoid pixelation.
     SCALE_UP_LIMIT = 2.0
 
+    # Pre-shrink large sources with `Image.reduce` down to 3x the target
+    # size before the Lanczos pass; output is visually indistinguishable.
+    REDUCING_GAP = 3.0
+
+    # Blur radius from which backgrounds are blurred at half resolution.
+    BLUR_DOWNSCALE_MIN_RADIUS = 16
+
     def __init__(
         self,
         output_size: tuple[int, int] = (700, 365),
         config: Config | None = None,
     ) -> None:
-        self.output_width = output_size[0]
-        self.output_height = output_size[1]
+        self._output_width = output_size[0]
+        self._output_height = output_size[1]
+        self._update_template_cache()
         self.config = config or Config()
 
+    @property
+    def output_width(self) -> int:
+        """
+        Template width in pixels.
+        """
+        return self._output_width
+
+    @output_width.setter
+    def output_width(self, value: int) -> None:
+        self._output_width = value
+        self._update_template_cache()
+
+    @property
+    def output_height(self) -> int:
+        """
+        Template height in pixels.
+        """
+        return self._output_height
+
+    @output_height.setter
+    def output_height(self, value: int) -> None:
+        self._output_height = value
+        self._update_template_cache()
+
+    def _update_template_cache(self) -> None:
+        """
+        Recomputes the template-derived values used on every image.
+        """
+        self._template_is_landscape = self._output_width > self._output_height
+        self._template_is_portrait = self._output_width < self._output_height
+        # The foreground fits within 80% of the template
+        self._foreground_max_w = int(self._output_width * 0.8)
+        self._foreground_max_h = int(self._output_height * 0.8)
+
     def process_image(self, image: Image.Image) -> Image.Image | None:
         """
         Creates a new PIL image from `image` by resizing it
         to fit the template dimensions.
 
+        For large JPEGs, prefer `process_path`, or open the image with `open`
+        (or call `image.draft` yourself) before it is loaded.
+
         Args:
             image (Image.Image): A PIL image object
         """
@@ -59,17 +231,104 @@ class Imager:
             raise ValueError("Source image must be a PIL Image object")
         return self._resize_to_template(image)
 
+    def process_array(self, array: "np.ndarray") -> "np.ndarray | None":
+        """
+        Creates a new image array from `array` by resizing it to fit
+        the template dimensions. The result is a writable H×W×3 uint8
+        array; the alpha channel of H×W×4 input is dropped.
+
+        Args:
+            array (np.ndarray): A H×W×3 (RGB) or H×W×4 (RGBA) uint8 array.
+        """
+        if np is None:
+            raise ImportError("process_array requires NumPy")
+        if (
+            not isinstance(array, np.ndarray)
+            or array.dtype != np.uint8
+            or array.ndim != 3
+            or array.shape[2] not in (3, 4)
+        ):
+            raise ValueError("Source array must be a H×W×3 or H×W×4 uint8 array")
+
+        image = Image.fromarray(np.ascontiguousarray(array))
+        output = self.process_image(image)
+        if output is None:
+            return None
+        return np.array(output)
+
+    def process_path(self, path: str | os.PathLike[str]) -> Image.Image | None:
+        """
+        Opens the image at `path` with `open`, so large JPEGs are decoded
+        at a reduced scale, and processes it.
+
+        Args:
+            path (str | os.PathLike[str]): Image file path.
+        """
+        try:
+            with self.open(path) as image:
+                return self.process_image(image)
+        except OSError as err:
+            logger.error("Unable to open image %s: %s", path, err)
+            return None
+
+    def open(self, path: str | os.PathLike[str]) -> Image.Image:
+        """
+        Opens the image at `path`. JPEG images are set to decode at the
+        smallest DCT scale (1/2, 1/4 or 1/8) that still covers twice the
+        template size, which skips most of the decoding and resizing work
+        for large photos.
+
+        Args:
+            path (str | os.PathLike[str]): Image file path.
+        """
+        image = Image.open(path)
+        image.draft("RGB", (self.output_width * 2, self.output_height * 2))
+        return image
+
+    def process_many(
+        self, images: Iterable[Image.Image], workers: int | None = None
+    ) -> list[Image.Image | None]:
+        """
+        Processes `images` in parallel across a pool of worker processes.
+        Results are returned in input order.
+
+        Images are pickled to the workers as raw pixels; prefer
+        `process_paths` when the images are stored on disk.
+
+        Args:
+            images (Iterable[Image.Image]): PIL image objects.
+            workers (int | None): Number of worker processes
+            (default: the number of CPUs).
+        """
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.process_image, images))
+
+    def process_paths(
+        self, paths: Iterable[str | os.PathLike[str]], workers: int | None = None
+    ) -> list[Image.Image | None]:
+        """
+        Opens and processes the images at `paths` in parallel across a pool
+        of worker processes. Results are returned in input order.
+
+        Args:
+            paths (Iterable[str | os.PathLike[str]]): Image file paths.
+            workers (int | None): Number of worker processes
+            (default: the number of CPUs).
+        """
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.process_path, paths))
+
     def is_template_landscape(self) -> bool:
         """
         Check if the template is landscape oriented.
         """
-        return self.output_width > self.output_height
+        return self._template_is_landscape
 
     def is_template_portrait(self) -> bool:
         """
         Check if the template is portrait/vertical oriented.
         """
-        return self.output_width < self.output_height
+        return self._template_is_portrait
 
     def _resize_to_template(self, image: Image.Image) -> Image.Image | None:
         """
@@ -124,15 +383,16 @@ class Imager:
 
     def _convert_image_mode(self, image: Image.Image) -> Image.Image:
         """
-        Returns the `image` converted to RGBA or RGB mode,
-        or the original, nonconverted input image, if it has a different mode.
+        Returns the `image` converted to RGB mode if it is a palette or RGBA
+        image, or the original, nonconverted input image, if it has a different mode.
 
         Args:
             image (Image.Image): The image to be processed
         """
-        if image.mode == "P":
+        if image.mode == "P" and isinstance(image.info.get("transparency"), bytes):
+            # Pillow warns on converting these straight to RGB
             image = image.convert("RGBA")
-        if image.mode == "RGBA":
+        if image.mode in ("P", "RGBA"):
             image = image.convert("RGB")
         return image
 
@@ -144,18 +404,21 @@ class Imager:
             image (Image.Image): The original image to be resized and cropped.
         """
         projected_w = self.output_width
-        projected_h = int(self.output_width * image.height / image.width)
+        projected_h = self.output_width * image.height // image.width
 
-        resized = image.resize(
-            (projected_w, projected_h), resample=Image.Resampling.LANCZOS
-        )
         crop_box = (
             0,
             (projected_h - self.output_height) // 4,
             self.output_width,
             (projected_h - self.output_height) // 4 + self.output_height,
         )
-        return resized.crop(crop_box)
+        source_box = self._project_crop_box(image, (projected_w, projected_h), crop_box)
+        return _fast_resize(
+            image,
+            (self.output_width, self.output_height),
+            source_box,
+            reducing_gap=self.REDUCING_GAP,
+        )
 
     def _fit_landscape_to_portrait(self, image: Image.Image) -> Image.Image:
         """
@@ -165,18 +428,21 @@ class Imager:
             image (Image.Image): The original image to be resized and cropped.
         """
         projected_h = self.output_height
-        projected_w = int(self.output_height * image.width / image.height)
+        projected_w = self.output_height * image.width // image.height
 
-        resized = image.resize(
-            (projected_w, projected_h), resample=Image.Resampling.LANCZOS
-        )
         crop_box = (
             (projected_w - self.output_width) // 4,
             0,
             (projected_w - self.output_width) // 4 + self.output_width,
             self.output_height,
         )
-        return resized.crop(crop_box)
+        source_box = self._project_crop_box(image, (projected_w, projected_h), crop_box)
+        return _fast_resize(
+            image,
+            (self.output_width, self.output_height),
+            source_box,
+            reducing_gap=self.REDUCING_GAP,
+        )
 
     def _fit_wide_to_landscape(self, image: Image.Image) -> Image.Image:
         """
@@ -187,17 +453,22 @@ class Imager:
             image (Image.Image): The image to be processed.
         """
         if self.config.force_fit:
-            projected_w = int(self.output_height * image.width / image.height)
-            resized = image.resize(
-                (projected_w, self.output_height), resample=Image.Resampling.LANCZOS
-            )
+            projected_w = self.output_height * image.width // image.height
             crop_box = (
                 (projected_w - self.output_width) // 2,
                 0,
                 (projected_w - self.output_width) // 2 + self.output_width,
                 self.output_height,
             )
-            return resized.crop(crop_box)
+            source_box = self._project_crop_box(
+                image, (projected_w, self.output_height), crop_box
+            )
+            return _fast_resize(
+                image,
+                (self.output_width, self.output_height),
+                source_box,
+                reducing_gap=self.REDUCING_GAP,
+            )
         return self._resize_proportionally(image)
 
     def _fit_tall_to_portrait(self, image: Image.Image) -> Image.Image:
@@ -209,19 +480,51 @@ class Imager:
             image (Image.Image): The image to be processed.
         """
         if self.config.force_fit:
-            projected_h = int(self.output_width * image.height / image.width)
-            resized = image.resize(
-                (self.output_width, projected_h), resample=Image.Resampling.LANCZOS
-            )
+            projected_h = self.output_width * image.height // image.width
             crop_box = (
                 0,
                 (projected_h - self.output_height) // 2,
                 self.output_width,
                 (projected_h - self.output_height) // 2 + self.output_height,
             )
-            return resized.crop(crop_box)
+            source_box = self._project_crop_box(
+                image, (self.output_width, projected_h), crop_box
+            )
+            return _fast_resize(
+                image,
+                (self.output_width, self.output_height),
+                source_box,
+                reducing_gap=self.REDUCING_GAP,
+            )
         return self._resize_proportionally(image)
 
+    def _project_crop_box(
+        self,
+        image: Image.Image,
+        projected_size: tuple[int, int],
+        crop_box: tuple[int, int, int, int],
+    ) -> tuple[float, float, float, float]:
+        """
+        Maps a `crop_box` on the `image` resized to `projected_size` back
+        to the matching region of the original `image`, so the resize and
+        crop can be done in a single pass.
+
+        Args:
+            image (Image.Image): The original image.
+            projected_size (tuple[int, int]): Size the image would be resized to.
+            crop_box (tuple[int, int, int, int]): Crop coordinates on the resized image.
+        """
+        scale_x = image.width / projected_size[0]
+        scale_y = image.height / projected_size[1]
+        left, top, right, bottom = crop_box
+
+        return (
+            max(0.0, left * scale_x),
+            max(0.0, top * scale_y),
+            min(float(image.width), right * scale_x),
+            min(float(image.height), bottom * scale_y),
+        )
+
     def _resize_proportionally(self, image: Image.Image) -> Image.Image:
         """
         Resizes the `image` proportionally to fit the template dimensions.
@@ -230,13 +533,17 @@ class Imager:
             image (Image.Image): The image to be resized.
         """
         if self.is_template_landscape():
-            projected_h = int(self.output_width * image.height / image.width)
-            return image.resize(
-                (self.output_width, projected_h), resample=Image.Resampling.LANCZOS
+            projected_h = self.output_width * image.height // image.width
+            return _fast_resize(
+                image,
+                (self.output_width, projected_h),
+                reducing_gap=self.REDUCING_GAP,
             )
-        projected_w = int(self.output_height * image.width / image.height)
-        return image.resize(
-            (projected_w, self.output_height), resample=Image.Resampling.LANCZOS
+        projected_w = self.output_height * image.width // image.height
+        return _fast_resize(
+            image,
+            (projected_w, self.output_height),
+            reducing_gap=self.REDUCING_GAP,
         )
 
     def _create_combo(self, image: Image.Image) -> Image.Image | None:
@@ -249,11 +556,13 @@ class Imager:
             image (Image.Image): The image to be processed.
         """
         try:
-            foreground = self._create_foreground_image(image)
-            background = self._create_background_image(image)
+            source = self._reduce_combo_source(image)
+            foreground = self._create_foreground_image(source)
+            background = self._create_background_image(source)
 
             top_left_x = (self.output_width - foreground.width) // 2
             top_left_y = (self.output_height - foreground.height) // 2
+            self._draw_border(background, foreground, (top_left_x, top_left_y))
 
             # Use the alpha channel for pasting if foreground is RGBA
             if foreground.mode == "RGBA":
@@ -265,18 +574,37 @@ class Imager:
             logger.error("Unable to create combo image: %s", err)
             return None
 
+    def _reduce_combo_source(self, image: Image.Image) -> Image.Image:
+        """
+        Returns the `image` shrunk by the largest integer factor that keeps
+        it at least twice the template size, so the foreground and background
+        resizes share one cheap box reduction instead of each scanning
+        the full-resolution source.
+
+        Args:
+            image (Image.Image): The image to be processed.
+        """
+        factor = max(
+            1,
+            min(
+                image.width // (self.output_width * 2),
+                image.height // (self.output_height * 2),
+            ),
+        )
+        if factor > 1:
+            return image.reduce(factor)
+        return image
+
     def _create_foreground_image(self, image: Image.Image) -> Image.Image:
         """
         Returns the `image` prepared to be used as foreground by resizing
-        it and adding a colored border.
+        it and enhancing its contrast.
 
         Args:
             image (Image.Image): The image to be used for creating the foreground.
         """
-        foreground = image.copy()
-        foreground = self._resize_foreground(foreground)
+        foreground = self._resize_foreground(image)
         foreground = ImageOps.autocontrast(foreground)
-        foreground = self._apply_border(foreground)
         return foreground
 
     def _resize_foreground(self, image: Image.Image) -> Image.Image:
@@ -286,15 +614,43 @@ class Imager:
         Args:
             image (Image.Image): The image to be processed.
         """
-        max_w = int(self.output_width * 0.8)
-        max_h = int(self.output_height * 0.8)
+        max_w = self._foreground_max_w
+        max_h = self._foreground_max_h
 
         if self._should_scale_up(image, max_w, max_h):
             return self._scale_up_image(image, max_w, max_h)
 
-        # Scale down using thumbnail (maintains aspect ratio, never enlarges)
-        image.thumbnail((max_w, max_h), resample=Image.Resampling.LANCZOS)
-        return image
+        # Scale down like `thumbnail` (maintains aspect ratio, never enlarges,
+        # pre-reduces with thumbnail's default reducing gap)
+        thumbnail_size = self._calculate_thumbnail_size(image, max_w, max_h)
+        if thumbnail_size == image.size:
+            return image
+        return _fast_resize(image, thumbnail_size, reducing_gap=2.0)
+
+    def _calculate_thumbnail_size(
+        self, image: Image.Image, max_w: int, max_h: int
+    ) -> tuple[int, int]:
+        """
+        Calculates the size `Image.thumbnail` would shrink the `image` to
+        for the given bounding box.
+
+        Args:
+            image (Image.Image): The image to be processed.
+            max_w (int): Maximum allowed width.
+            max_h (int): Maximum allowed height.
+        """
+        if max_w >= image.width and max_h >= image.height:
+            return image.size
+
+        aspect = image.width / image.height
+        if max_w / max_h >= aspect:
+            candidates = (math.floor(max_h * aspect), math.ceil(max_h * aspect))
+            width = min(candidates, key=lambda n: abs(aspect - n / max_h))
+            return max(width, 1), max_h
+
+        candidates = (math.floor(max_w / aspect), math.ceil(max_w / aspect))
+        height = min(candidates, key=lambda n: 0 if n == 0 else abs(aspect - max_w / n))
+        return max_w, max(height, 1)
 
     def _should_scale_up(self, image: Image.Image, max_w: int, max_h: int) -> bool:
         """
@@ -329,52 +685,57 @@ class Imager:
         new_h = int(orig_h * scale_ratio)
 
         if new_w > 0 and new_h > 0:
-            return image.resize((new_w, new_h), resample=Image.Resampling.LANCZOS)
+            return _fast_resize(image, (new_w, new_h))
         return image
 
-    def _apply_border(self, image: Image.Image) -> Image.Image:
+    def _draw_border(
+        self,
+        background: Image.Image,
+        foreground: Image.Image,
+        position: tuple[int, int],
+    ) -> None:
         """
-        Applies a border to the foreground `image`, if configured.
+        Draws the foreground border, if configured, directly onto the
+        `background` around the area where `foreground` will be pasted.
 
         Args:
-            image (Image.Image): The image to be processed.
+            background (Image.Image): The image to draw on.
+            foreground (Image.Image): The foreground to be framed.
+            position (tuple[int, int]): Top-left corner of the foreground.
         """
         if (
             not self.config.foreground_border
             or self.config.foreground_border_width <= 0
         ):
-            return image
-
-        has_transparent_border = len(self.config.foreground_border_color) == 4
-        image = self._convert_image_for_border(image, has_transparent_border)
-
-        border_width = self._calculate_safe_border_width(image)
-        if border_width > 0:
-            image = ImageOps.expand(
-                image,
-                border=border_width,
-                fill=self.config.foreground_border_color,
+            return
+
+        border_width = self._calculate_safe_border_width(foreground)
+        if border_width <= 0:
+            return
+
+        left = position[0] - border_width
+        top = position[1] - border_width
+        right = position[0] + foreground.width + border_width
+        bottom = position[1] + foreground.height + border_width
+        color = self.config.foreground_border_color
+
+        # Only the frame is drawn; the foreground covers the interior anyway
+        if background.mode == "RGB":
+            # Blend semi-transparent border colors instead of overwriting
+            draw = ImageDraw.Draw(background, "RGBA" if len(color) == 4 else None)
+            draw.rectangle(
+                (left, top, right - 1, bottom - 1), outline=color, width=border_width
             )
+            return
 
-        return image
-
-    def _convert_image_for_border(
-        self, image: Image.Image, has_transparent_border: bool
-    ) -> Image.Image:
-        """
-        Converts the `image` to appropriate mode for border application.
-
-        Args:
-            image (Image.Image): The image to be processed.
-            has_transparent_border (bool): Border transparency setting.
-        """
-        if has_transparent_border:
-            if image.mode != "RGBA":
-                return image.convert("RGBA")
-        else:
-            if image.mode == "RGBA":
-                return image.convert("RGB")
-        return image
+        # Other modes cannot blend an RGBA outline; paste the four strips
+        # through their alpha instead
+        horizontal = Image.new("RGBA", (right - left, border_width), color)
+        background.paste(horizontal, (left, top), horizontal)
+        background.paste(horizontal, (left, bottom - border_width), horizontal)
+        vertical = Image.new("RGBA", (border_width, foreground.height), color)
+        background.paste(vertical, (left, position[1]), vertical)
+        background.paste(vertical, (right - border_width, position[1]), vertical)
 
     def _calculate_safe_border_width(self, image: Image.Image) -> int:
         """
@@ -409,22 +770,38 @@ class Imager:
             image (Image.Image): The image to be used for creating
             the background.
         """
-        image_copy = image.copy()
-        canvas = self._resize_image_for_background(image_copy)
-        crop_box = self._calculate_background_crop_box(canvas)
-        background = self._crop_image_and_ensure_size(canvas, crop_box)
+        background = self._resize_image_for_background(image)
 
         if self.config.background_blur:
-            background = background.filter(
-                ImageFilter.GaussianBlur(radius=self.config.background_blur_radius)
-            )
+            background = self._blur_background(background)
 
         return background
 
+    def _blur_background(self, background: Image.Image) -> Image.Image:
+        """
+        Blurs the `background`. Large radii are applied at half resolution
+        and scaled back up, which is visually identical since the blur
+        removes the lost detail anyway.
+
+        Args:
+            background (Image.Image): The image to be blurred.
+        """
+        radius = self.config.background_blur_radius
+        if radius < self.BLUR_DOWNSCALE_MIN_RADIUS or min(background.size) < 2:
+            return _fast_gaussian_blur(background, radius)
+
+        small = background.reduce(2)
+        small = _fast_gaussian_blur(small, radius / 2)
+        return small.resize(background.size, resample=_BILINEAR)
+
     def _resize_image_for_background(self, image: Image.Image) -> Image.Image:
         """
         Resizes the `image` for background, covering the entire template.
 
+        Only the centered region of the source that ends up in the template
+        is resized, directly to the template size, so no oversized canvas
+        has to be allocated and cropped.
+
         Args:
             image (Image.Image): The image to be processed.
         """
@@ -434,7 +811,16 @@ class Imager:
             logger.warning("Invalid canvas size calculated for background.")
             return Image.new("RGB", (self.output_width, self.output_height))
 
-        return image.resize((canvas_w, canvas_h), resample=Image.Resampling.LANCZOS)
+        left = (canvas_w - self.output_width) // 2
+        top = (canvas_h - self.output_height) // 2
+        crop_box = (left, top, left + self.output_width, top + self.output_height)
+        source_box = self._project_crop_box(image, (canvas_w, canvas_h), crop_box)
+        return _fast_resize(
+            image,
+            (self.output_width, self.output_height),
+            source_box,
+            reducing_gap=self.REDUCING_GAP,
+        )
 
     def _calculate_canvas_dimensions(self, image: Image.Image) -> tuple[int, int]:
         """
@@ -455,17 +841,17 @@ class Imager:
         Args:
             image (Image.Image): The image to be processed.
         """
-        image_ratio = image.width / image.height
-        template_ratio = self.output_width / self.output_height
+        width, height = image.size
 
-        if image_ratio < template_ratio:
+        # Compare aspect ratios by cross-multiplying, without float division
+        if width * self.output_height < height * self.output_width:
             # Image is narrower, fit by width
             canvas_w = self.output_width
-            canvas_h = int(self.output_width * image.height / image.width)
+            canvas_h = self.output_width * height // width
         else:
             # Image is wider, fit by height
             canvas_h = self.output_height
-            canvas_w = int(self.output_height * image.width / image.height)
+            canvas_w = self.output_height * width // height
 
         return canvas_w, canvas_h
 
@@ -476,59 +862,20 @@ class Imager:
         Args:
             image (Image.Image): The image to be processed.
         """
-        image_ratio = image.width / image.height
-        template_ratio = self.output_width / self.output_height
+        width, height = image.size
 
-        if image_ratio > template_ratio:
+        # Compare aspect ratios by cross-multiplying, without float division
+        if width * self.output_height > height * self.output_width:
             # Image is wider, fit by height
             canvas_h = self.output_height
-            canvas_w = int(self.output_height * image.width / image.height)
+            canvas_w = self.output_height * width // height
         else:
             # Image is narrower, fit by width
             canvas_w = self.output_width
-            canvas_h = int(self.output_width * image.height / image.width)
+            canvas_h = self.output_width * height // width
 
         return canvas_w, canvas_h
 
-    def _calculate_background_crop_box(
-        self, canvas: Image.Image
-    ) -> tuple[int, int, int, int]:
-        """
-        Calculates the crop box to center the canvas on the template.
-
-        Args:
-            canvas (Image.Image): The image to be used as canvas.
-        """
-        canvas_w, canvas_h = canvas.size
-
-        left = max(0, (canvas_w - self.output_width) // 2)
-        top = max(0, (canvas_h - self.output_height) // 2)
-        right = min(canvas_w, left + self.output_width)
-        bottom = min(canvas_h, top + self.output_height)
-
-        return (left, top, right, bottom)
-
-    def _crop_image_and_ensure_size(
-        self, canvas: Image.Image, crop_box: tuple[int, int, int, int]
-    ) -> Image.Image:
-        """
-        Crops the canvas and ensures final size matches template exactly.
-
-        Args:
-            canvas (Image.Image): The image to be resized.
-            crop_box (tuple[int, int, int, int]): Crop coordinates.
-        """
-        background = canvas.crop(crop_box)
-
-        # Handle potential rounding errors
-        if background.size != (self.output_width, self.output_height):
-            background = background.resize(
-                (self.output_width, self.output_height),
-                resample=Image.Resampling.LANCZOS,
-            )
-
-        return background
-
     def is_image_portrait(self, image: Image.Image) -> bool:
         """
         Checks if `image` has a portrait aspect ratio.
@@ -536,7 +883,8 @@ class Imager:
         Args:
             image (Image.Image): The image to be bordered.
         """
-        return image.width < image.height
+        width, height = image.size
+        return width < height
 
     def is_image_landscape(self, image: Image.Image) -> bool:
         """
@@ -545,7 +893,8 @@ class Imager:
         Args:
             image (Image.Image): The image to be bordered.
         """
-        return image.width > image.height
+        width, height = image.size
+        return width > height
 
     def is_image_square(self, image: Image.Image) -> bool:
         """
@@ -554,7 +903,8 @@ class Imager:
         Args:
             image (Image.Image): The image to be bordered.
         """
-        return not self.is_image_portrait(image) and not self.is_image_landscape(image)
+        width, height = image.size
+        return width == height
 
     def is_image_too_small_for_template(self, image: Image.Image) -> bool:
         """
@@ -565,9 +915,10 @@ class Imager:
             image (Image.Image): The image to be bordered.
         """
         threshold = 0.75
+        width, height = image.size
         return (
-            image.width < threshold * self.output_width
-            or image.height < threshold * self.output_height
+            width < threshold * self.output_width
+            or height < threshold * self.output_height
         )
 
     def is_image_too_narrow_for_template(self, image: Image.Image) -> bool:
@@ -578,7 +929,8 @@ class Imager:
         Args:
             image (Image.Image): The image to be bordered.
         """
-        return image.width / image.height < self.output_width / self.output_height
+        width, height = image.size
+        return width * self.output_height < height * self.output_width
 
     def is_image_too_wide_for_template(self, image: Image.Image) -> bool:
         """
@@ -588,4 +940,5 @@ class Imager:
         Args:
             image (Image.Image): The image to be bordered.
         """
-        return image.width / image.height > self.output_width / self.output_height
+        width, height = image.size
+        return width * self.output_height > height * self.output_width